@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Type
+from typing import ClassVar, Dict, List, Optional, Callable, Type
 from permits_scraper.schemas.permit_record import PermitRecord
 from pydantic import BaseModel, PrivateAttr, Field, ConfigDict
 import asyncio
@@ -17,6 +17,11 @@ class PermitDetailsBaseScraper(ABC, BaseModel):
 
     _region: str = PrivateAttr(..., init=True)
     _city: str = PrivateAttr(..., init=True)
+    # Lazily opened append-only results log (see ``persist_result_jsonl``).
+    _results_log: Optional[object] = PrivateAttr(default=None)
+    # Per-subclass cache for the resolved output directory (see
+    # ``_result_output_dir``); each scraper class resolves its path once.
+    _out_dir_cache: ClassVar[Optional[Path]] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
 
@@ -104,11 +109,21 @@ class PermitDetailsBaseScraper(ABC, BaseModel):
         Path
             Directory path ``permits_scraper/data/regions/tx/san_antonio`` relative
             to the package root. The directory is created if it does not exist.
+
+        Notes
+        -----
+        The resolved path is cached per scraper class: this method is called
+        from the per-permit persistence hot path, and re-running the
+        ``Path.resolve`` walk plus ``mkdir(exist_ok=True)`` stat costs one
+        batch of syscalls per permit for an answer that never changes.
         """
-        pkg_root = Path(__file__).resolve().parents[2]
-        out_dir = pkg_root / "data" / "regions" / "permits_details" / self._region / self._city
-        out_dir.mkdir(parents=True, exist_ok=True)
-        return out_dir
+        cls = type(self)
+        if cls._out_dir_cache is None:
+            pkg_root = Path(__file__).resolve().parents[2]
+            out_dir = pkg_root / "data" / "regions" / "permits_details" / self._region / self._city
+            out_dir.mkdir(parents=True, exist_ok=True)
+            cls._out_dir_cache = out_dir
+        return cls._out_dir_cache
 
     def persist_result(self, permit_number: str, result: PermitRecord) -> str:
         """Atomically persist a single permit result to a JSON file.
@@ -149,6 +164,50 @@ class PermitDetailsBaseScraper(ABC, BaseModel):
             except Exception:
                 pass
 
+    def persist_result_jsonl(self, permit_number: str, result: PermitRecord) -> None:
+        """Append a single permit result to the run's ``results.jsonl`` log.
+
+        Appending one compact JSON line per permit is far cheaper than the
+        per-file atomic replace in ``persist_result`` (no temp file, no
+        directory churn, no pretty-printing) and still crash-safe: a
+        partially written trailing line is trivially skipped on read.
+        Scrapers that do not rely on per-permit files for resume logic
+        should prefer this writer on large batches.
+
+        Parameters
+        ----------
+        permit_number : str
+            The permit/application identifier, stored alongside the record.
+        result : PermitRecord
+            The parsed result to serialize and append.
+        """
+        try:
+            if self._results_log is None:
+                self._results_log = open(self._result_output_dir() / "results.jsonl", "a", encoding="utf-8")
+            line = json.dumps(
+                {"permit_number": permit_number, "record": result.model_dump(mode="json")},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            self._results_log.write(line + "\n")
+            # Flush per append: the crash-safety claim above only holds if
+            # records leave userspace buffers as they are written.
+            self._results_log.flush()
+        except Exception as e:
+            # Best-effort persistence; do not fail the scrape due to IO errors
+            try:
+                logging.exception("Failed to append result for %s: %s", permit_number, e)
+            except Exception:
+                pass
+
+    def close_results_log(self) -> None:
+        """Flush and close the append-only results log, if open."""
+        if self._results_log is not None:
+            try:
+                self._results_log.close()
+            finally:
+                self._results_log = None
+
     def process_progress_callback(self, progress_callback: Optional[Callable[[int, int, Optional[int]], None]], success_chunks_inc: int, failed_chunks_inc: int, total_chunks: Optional[int] = None) -> None:
         """Process the progress callback."""
         if progress_callback is not None:
@@ -4,6 +4,19 @@ from pydantic import BaseModel, PrivateAttr
 from playwright.async_api import BrowserContext, Route
 from abc import ABC
 
+# Hoisted out of the route handler: the handler runs once per intercepted
+# request, so the membership structures must not be rebuilt per page.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_URL_FRAGMENTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+
 class PlaywrightBaseScraper(ABC, BaseModel):
     """Base class for Playwright scrapers."""
 
@@ -34,19 +47,21 @@ class PlaywrightBaseScraper(ABC, BaseModel):
 
         Notes
         -----
-        Blocks resource types: ``image``, ``media``, ``font``, ``stylesheet``.
-        Keeps ``document``, ``script``, ``xhr``, and ``fetch`` to ensure
-        dynamic content and the DOM are still rendered.
+        Blocks resource types: ``image``, ``media``, ``font``, ``stylesheet``,
+        plus requests to well-known analytics/tracker hosts regardless of
+        resource type. Keeps ``document``, ``script``, ``xhr``, and ``fetch``
+        to ensure dynamic content and the DOM are still rendered.
         """
-        blocked_types = {"image", "media", "font", "stylesheet"}
-
         async def handler(route: Route):  # type: ignore[no-untyped-def]
-            try:
-                if route.request.resource_type in blocked_types:
+            # Hot path: one membership test + substring scan per request,
+            # with no try/except entered until the verdict is known.
+            request = route.request
+            if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(f in request.url for f in _BLOCKED_URL_FRAGMENTS):
+                try:
                     await route.abort()
-                else:
-                    await route.continue_()
-            except Exception:
+                except Exception:
+                    pass
+            else:
                 try:
                     await route.continue_()
                 except Exception:
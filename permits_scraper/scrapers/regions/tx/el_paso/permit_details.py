@@ -20,21 +20,47 @@ Design
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from typing import Optional, Dict, List, Callable, Union
+import string
+from typing import Optional, Dict, List, Callable, Tuple, Union
 from pydantic import BaseModel, Field
 from pathlib import Path
 import pandas as pd
 
 
 from bs4 import BeautifulSoup
-from playwright.async_api import Browser, Locator, Page, async_playwright
+import soupsieve
+from playwright.async_api import Browser, Page, async_playwright
 from permits_scraper.scrapers.base.playwright_permit_details import PlaywrightPermitDetailsBaseScraper
 
 from permits_scraper.schemas.contacts import OwnerData
 from permits_scraper.schemas.permit_record import PermitRecord
 
+# Deleting lowercase chars and comparing to the original detects all-uppercase
+# company names in C instead of a per-call join + char-by-char Python loop.
+_LOWERCASE_TABLE = str.maketrans("", "", string.ascii_lowercase)
+
+# Fused phone normalization for the Licensed Professional block: one
+# alternation handles both labels in a single pass over the raw text.
+_LIC_PHONE_RE = re.compile(r"(Home Phone:|Mobile Phone:)\s*(?:\n\s*)?([0-9\-\(\)\s]+)")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# The Accela detail markup is a fixed template (only values change between
+# permits), so CSS selectors are compiled once per process instead of being
+# re-parsed on every select_one call.
+_SEL_PERMIT_NUMBER = soupsieve.compile('#ctl00_PlaceHolderMain_lblPermitNumber')
+_SEL_FIRSTNAME = soupsieve.compile('.contactinfo_firstname')
+_SEL_LASTNAME = soupsieve.compile('.contactinfo_lastname')
+_SEL_BUSINESSNAME = soupsieve.compile('.contactinfo_businessname')
+_SEL_ADDRESSLINE1 = soupsieve.compile('.contactinfo_addressline1')
+_SEL_REGION = soupsieve.compile('.contactinfo_region')
+_SEL_CONTACT_IDS = {
+    suffix: soupsieve.compile(f'[id$="{suffix}"]')
+    for suffix in ("PhoneHome", "PhoneWork", "PhoneMobile", "Email")
+}
+
 
 class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
     """Scraper for El Paso (TX) Accela permit details.
@@ -153,6 +179,14 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         if isinstance(permit_overview, Path):
             permit_overview = pd.read_csv(permit_overview)
         permit_data = permit_overview.copy()
+        # Fail fast with the offending names: the batched projection below
+        # would otherwise raise a bare KeyError for the whole run.
+        required_columns = [permits_column, "Status", "Date", "Building Type", "Project Name", "Description"]
+        missing_columns = [c for c in required_columns if c not in permit_data.columns]
+        if missing_columns:
+            raise ValueError(
+                f"Permit overview is missing required columns: {missing_columns}. Available: {list(permit_data.columns)}"
+            )
         permit_data.drop_duplicates(subset=[permits_column], inplace=True)
         permit_data: pd.DataFrame = permit_data[permit_data[permits_column].isin(permit_numbers)]
 
@@ -162,24 +196,35 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
             context = await browser.new_context()
             await self._configure_network_blocking(context)
             page: Page = await context.new_page()
+            # Batched writer: results are queued on the hot loop and flushed
+            # off-loop so per-permit disk writes don't stall scraping.
+            write_q: asyncio.Queue[Optional[Tuple[str, PermitRecord]]] = asyncio.Queue()
+            writer_task = asyncio.create_task(self._drain_write_queue(write_q))
             try:
-                for _, row in permit_data.iterrows():
+                # itertuples avoids building a pandas Series (and per-column label lookups) for every row
+                records = permit_data[required_columns].itertuples(index=False, name=None)
+                first_navigation = True
+                for permit_number, status, application_date, building_type, project_name, description in records:
                     try:
-                        permit_number = row[permits_column]
                         success = False
-                        await self._goto_search_page(page)
+                        # Reload the search page only when the in-page reset
+                        # fails; a full goto per permit costs a round trip plus
+                        # cookie/JS reinitialization on every iteration.
+                        if first_navigation or not await self._reset_search_form(page):
+                            await self._goto_search_page(page)
+                        first_navigation = False
                         await self._submit_search(page, permit_number)
                         # Ensure we are on the details page; click the result link if needed
                         await self._ensure_details_open(page, permit_number)
 
                         # Parse details from live page content using the same HTML parser for consistency
                         result = await self._extract_record_from_page(page, permit_number)
-                        result.status = row["Status"]
-                        result.application_date = row["Date"]
-                        result.building_type = row["Building Type"]
-                        result.project_name = row["Project Name"]
-                        result.description = row["Description"]
-                        self.persist_result(permit_number, result)
+                        result.status = status
+                        result.application_date = application_date
+                        result.building_type = building_type
+                        result.project_name = project_name
+                        result.description = description
+                        write_q.put_nowait((permit_number, result))
                         results[permit_number] = result
                         success = True
                     except Exception as e:
@@ -189,8 +234,44 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
                         self.process_progress_callback(progress_callback, 1 if success else 0, 0 if success else 1, len(permit_numbers))
                 return results
             finally:
+                # Signal the writer to drain any queued results before closing
+                write_q.put_nowait(None)
+                await writer_task
                 await browser.close()
 
+    async def _drain_write_queue(
+        self,
+        write_q: "asyncio.Queue[Optional[Tuple[str, PermitRecord]]]",
+        batch_size: int = 20,
+    ) -> None:
+        """Persist queued results in batches off the scraping loop.
+
+        Parameters
+        ----------
+        write_q : asyncio.Queue
+            Queue of ``(permit_number, record)`` tuples; ``None`` signals the
+            end of the stream and triggers a final drain.
+        batch_size : int, default=20
+            Maximum number of results flushed per write batch.
+        """
+        done = False
+        while not done:
+            item = await write_q.get()
+            if item is None:
+                return
+            batch: List[Tuple[str, PermitRecord]] = [item]
+            while len(batch) < batch_size:
+                try:
+                    nxt = write_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if nxt is None:
+                    done = True
+                    break
+                batch.append(nxt)
+            for permit_number, record in batch:
+                await asyncio.to_thread(self.persist_result, permit_number, record)
+
     async def _extract_record_from_page(self, page: Page, permit_number: str) -> PermitRecord:
         """Extract and normalize a `PermitRecord` from the current details page.
 
@@ -218,7 +299,7 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         # Derive permit number from the page when available (handles prefixes like TBRNN...)
         try:
             soup = BeautifulSoup(html, "html.parser")
-            pn_node = soup.select_one('#ctl00_PlaceHolderMain_lblPermitNumber')
+            pn_node = _SEL_PERMIT_NUMBER.select_one(soup)
             page_permit_number = pn_node.get_text(strip=True) if pn_node is not None else permit_number
         except Exception:
             page_permit_number = permit_number
@@ -236,22 +317,46 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         """Navigate to the base search page and wait for network idle."""
         await page.goto(self._base_url, wait_until="domcontentloaded")
 
-    async def _submit_search(self, page: Page, permit_number: str) -> None:
-        """Fill the permit number and submit the search form."""
-        # Wait for the form to be ready
-        await page.wait_for_selector('input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]', state='visible')
+    async def _reset_search_form(self, page: Page) -> bool:
+        """Reset the in-page search form instead of reloading ``base_url``.
+
+        Parameters
+        ----------
+        page : Page
+            The Playwright page, expected to still be on the Accela portal.
 
-        permit_number_field: Locator = page.locator(
-            'input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]'
-        )
-        await permit_number_field.fill(permit_number)
+        Returns
+        -------
+        bool
+            True if the form was reset and the permit number field is visible
+            again; False if the caller should fall back to a full navigation.
+        """
+        try:
+            reset_button = page.locator('a[id*="btnReset"], a[id*="ClearSearch"]')
+            if await reset_button.count() == 0:
+                return False
+            await reset_button.first.click()
+            await page.wait_for_selector(
+                'input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]',
+                state='visible',
+                timeout=5000,
+            )
+            return True
+        except Exception:
+            return False
 
-        # Try with different selectors
-        search_button = page.locator('a[id="ctl00_PlaceHolderMain_btnNewSearch"]')
-        if await search_button.count() == 0:
-            search_button = page.locator('a:has-text("Search")')
+    async def _submit_search(self, page: Page, permit_number: str) -> None:
+        """Fill the permit number and submit the search form."""
+        # page.fill auto-waits for the field to be visible, so no separate
+        # wait_for_selector round trip is needed.
+        await page.fill('input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]', permit_number)
 
-        await search_button.click()
+        # The primary button id is stable; fall back to a text lookup only if
+        # clicking it times out, instead of a preemptive .count() probe.
+        try:
+            await page.click('a[id="ctl00_PlaceHolderMain_btnNewSearch"]', timeout=5000)
+        except Exception:
+            await page.click('a:has-text("Search")')
 
     async def _ensure_details_open(self, page: Page, permit_number: str) -> None:
         """Ensure the permit details page is open after a search.
@@ -268,54 +373,47 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
             The permit number used in the search. May differ on the page (e.g.,
             prefixed with a letter like 'T').
         """
-        try:
-            # Primary indicator present on details pages
-            await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=3000)
-            return
-        except Exception:
-            pass
-
-        # Try to click a result row link matching the permit number
         candidate_numbers = [permit_number]
         if not permit_number.startswith('T'):
             candidate_numbers.append('T' + permit_number)
+        link_selector = ", ".join(f'a:has-text("{pn}")' for pn in candidate_numbers)
+
+        # Race every known post-search state in a single wait instead of paying
+        # each fallback's timeout serially (~20s worst case before this change).
+        ready = page.locator(
+            '#ctl00_PlaceHolderMain_lblPermitNumber, '
+            '#ctl00_PlaceHolderMain_shPermitDetail_lblSectionTitle, '
+            f'table[id*="gdvPermitList"], {link_selector}'
+        ).first
+        try:
+            await ready.wait_for(state='visible', timeout=5000)
+        except Exception:
+            pass
 
-        for pn in candidate_numbers:
-            # Wait briefly for the results link to appear
-            try:
-                await page.wait_for_selector(f'a:has-text("{pn}")', timeout=5000)
-            except Exception:
-                pass
-            link = page.locator(f'a:has-text("{pn}")')
-            try:
-                if await link.count() > 0:
-                    await link.first.click()
-                    await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=5000)
-                    return
-            except Exception:
-                continue
+        # Already on the details page?
+        if await page.locator('#ctl00_PlaceHolderMain_lblPermitNumber').count() > 0:
+            return
 
-        # As a fallback, wait for the section title that indicates details area exists
+        # Results page: click a link matching the permit number (with or without T prefix)
+        link = page.locator(link_selector)
         try:
-            await page.wait_for_selector('#ctl00_PlaceHolderMain_shPermitDetail_lblSectionTitle', state='visible', timeout=3000)
-            return
+            if await link.count() > 0:
+                await link.first.click()
+                await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=5000)
+                return
         except Exception:
             pass
 
-        # Final fallback: click the first record number in results grid if present
+        # Section title indicates the details area already exists
+        if await page.locator('#ctl00_PlaceHolderMain_shPermitDetail_lblSectionTitle').count() > 0:
+            return
+
+        # Final fallback: click the first record link in the results grid
         try:
-            await page.wait_for_selector('table[id*="gdvPermitList"]', timeout=5000)
-            # Prefer a link that contains the permit number (with or without T prefix)
-            for pn in candidate_numbers:
-                candidate = page.locator(f'table[id*="gdvPermitList"] a:has-text("{pn}")')
-                if await candidate.count() > 0:
-                    await candidate.first.click()
-                    await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=5000)
-                    return
-            # Otherwise click the first record link
-            first_link = page.locator('table[id*="gdvPermitList"] a').first
-            await first_link.click()
-            await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=5000)
+            grid_links = page.locator('table[id*="gdvPermitList"] a')
+            if await grid_links.count() > 0:
+                await grid_links.first.click()
+                await page.wait_for_selector('#ctl00_PlaceHolderMain_lblPermitNumber', state='visible', timeout=5000)
             return
         except Exception:
             pass
@@ -359,42 +457,80 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         soup = BeautifulSoup(html, "html.parser")
         fields: Dict[str, object] = {}
 
-        owner = self._parse_owner_block(soup)
-        if owner is not None:
-            fields["owner"] = owner
-
-        licensed = self._parse_licensed_professional_block(soup)
-        if licensed is not None:
-            fields["licensed_professional"] = licensed
-
-        third_party = self._parse_third_party_block(soup)
-        if third_party is not None:
-            fields["third_party"] = third_party
-
-        job_value = self._parse_job_value_block(soup)
-        if job_value is not None:
-            fields["job_value"] = job_value
-
-        applicant = self._parse_applicant_block(soup)
-        if applicant is not None:
-            fields["applicant"] = applicant
+        # Cheap substring prescreen on the raw HTML: a C-level substring search
+        # is far cheaper than a tree scan, so skip sections whose label never
+        # appears anywhere in the document (common on partial detail pages).
+        has_owner = "Owner:" in html
+        has_lic = "Licensed Professional" in html
+        has_app = "Applicant:" in html
+        has_tp = "3RD PARTY" in html.upper()
+        has_job = "Job Value($):" in html
+        if not (has_owner or has_lic or has_app or has_tp or has_job):
+            return fields
+
+        # Locate all five section labels in a single pass over candidate tags
+        # instead of five independent full-tree `soup.find` scans.
+        owner_label = lic_label = app_label = tp_header = job_h2 = None
+        for tag in soup.find_all(["span", "h2", "h3"]):
+            text = tag.string
+            if not isinstance(text, str):
+                continue
+            stripped = text.strip()
+            if tag.name == "span":
+                if has_owner and owner_label is None and stripped.startswith("Owner:"):
+                    owner_label = tag
+                elif has_lic and lic_label is None and stripped.startswith("Licensed Professional:"):
+                    lic_label = tag
+                elif has_app and app_label is None and stripped.startswith("Applicant:"):
+                    app_label = tag
+            else:
+                if has_tp and tp_header is None and "3RD PARTY" in stripped.upper():
+                    tp_header = tag
+                if has_job and job_h2 is None and tag.name == "h2" and "Job Value($):" in text:
+                    job_h2 = tag
+
+        if has_owner:
+            owner = self._parse_owner_block(soup, owner_label)
+            if owner is not None:
+                fields["owner"] = owner
+
+        if has_lic:
+            licensed = self._parse_licensed_professional_block(soup, lic_label)
+            if licensed is not None:
+                fields["licensed_professional"] = licensed
+
+        if has_tp:
+            third_party = self._parse_third_party_block(soup, tp_header)
+            if third_party is not None:
+                fields["third_party"] = third_party
+
+        if has_job:
+            job_value = self._parse_job_value_block(soup, job_h2)
+            if job_value is not None:
+                fields["job_value"] = job_value
+
+        if has_app:
+            applicant = self._parse_applicant_block(soup, app_label)
+            if applicant is not None:
+                fields["applicant"] = applicant
 
         return fields
 
-    def _parse_owner_block(self, soup: BeautifulSoup) -> Optional[OwnerData]:
+    def _parse_owner_block(self, soup: BeautifulSoup, owner_label) -> Optional[OwnerData]:
         """Parse the Owner section.
 
         Parameters
         ----------
         soup : BeautifulSoup
             Parsed BeautifulSoup tree of the permit details page.
+        owner_label : Optional[Tag]
+            The ``Owner:`` label node located by `_parse_el_paso_html_fields`.
 
         Returns
         -------
         Optional[OwnerData]
             Owner data if found, otherwise ``None``.
         """
-        owner_label = soup.find("span", string=lambda s: isinstance(s, str) and s.strip().startswith("Owner:"))
         if owner_label is None:
             return None
 
@@ -443,7 +579,7 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         owner = OwnerData()
         if name_text:
             parts = [p for p in name_text.split() if p]
-            if len(parts) > 2 and any(c.islower() for c in "".join(parts)) is False:
+            if len(parts) > 2 and name_text.translate(_LOWERCASE_TABLE) == name_text:
                 owner.company_name = name_text
             elif len(parts) >= 2:
                 # Assume natural order: First Last
@@ -455,20 +591,22 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
             owner.address = re.sub(r"\s+", " ", addr_text).strip()
         return owner
 
-    def _parse_licensed_professional_block(self, soup: BeautifulSoup) -> Optional[str]:
+    def _parse_licensed_professional_block(self, soup: BeautifulSoup, lic_label) -> Optional[str]:
         """Parse the Licensed Professional section into a normalized string.
 
         Parameters
         ----------
         soup : BeautifulSoup
             Parsed BeautifulSoup tree of the permit details page.
+        lic_label : Optional[Tag]
+            The ``Licensed Professional:`` label node located by
+            `_parse_el_paso_html_fields`, if present.
 
         Returns
         -------
         Optional[str]
             Concatenated multiline string if found, otherwise ``None``.
         """
-        lic_label = soup.find("span", string=lambda s: isinstance(s, str) and s.strip().startswith("Licensed Professional:"))
         lic_container = None
         if lic_label is not None:
             lic_container = lic_label.find_parent().find_next_sibling("span")
@@ -490,23 +628,13 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
 
         lic_raw = target_node.get_text("\n", strip=True)
 
-        def _repl_home_phone(m: re.Match) -> str:  # type: ignore[name-defined]
-            digits = re.sub(r"\D", "", m.group(1))
-            return "Home Phone:\t" + digits
-
-        lic_raw = re.sub(r"Home Phone:\s*(?:\n\s*)?([0-9\-\(\)\s]+)", _repl_home_phone, lic_raw)
-
-        # Normalize Mobile Phone as well (if present) and ensure proper line breaks
-        def _repl_mobile_phone(m: re.Match) -> str:  # type: ignore[name-defined]
-            digits = re.sub(r"\D", "", m.group(1))
-            return "Mobile Phone:\t" + digits
+        # Normalize both phone labels and restore the line break swallowed by
+        # the digits match in a single rewrite, instead of five sequential
+        # re.sub passes over the full text.
+        def _normalize_phone(m: re.Match) -> str:  # type: ignore[name-defined]
+            return m.group(1) + "\t" + _NON_DIGIT_RE.sub("", m.group(2)) + "\n"
 
-        lic_raw = re.sub(r"Mobile Phone:\s*(?:\n\s*)?([0-9\-\(\)\s]+)", _repl_mobile_phone, lic_raw)
-
-        # Ensure line breaks between adjacent segments
-        lic_raw = re.sub(r"(Home Phone:\t\d+)\s*(Mobile Phone:)", r"\1\n\2", lic_raw)
-        lic_raw = re.sub(r"(Mobile Phone:\t\d+)\s*(Contractor General)", r"\1\n\2", lic_raw)
-        lic_raw = re.sub(r"(Home Phone:\t\d+)\s*(Contractor General)", r"\1\n\2", lic_raw)
+        lic_raw = _LIC_PHONE_RE.sub(_normalize_phone, lic_raw)
 
         lic_lines: List[str] = []
         for ln in lic_raw.split("\n"):
@@ -519,20 +647,22 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         # Do not truncate; keep all meaningful lines (some entries include multiple phone lines)
         return "\n".join(lic_lines) if lic_lines else None
 
-    def _parse_third_party_block(self, soup: BeautifulSoup) -> Optional[str]:
+    def _parse_third_party_block(self, soup: BeautifulSoup, tp_header) -> Optional[str]:
         """Parse the 3rd Party information section into a normalized string.
 
         Parameters
         ----------
         soup : BeautifulSoup
             Parsed BeautifulSoup tree of the permit details page.
+        tp_header : Optional[Tag]
+            The 3rd Party section header node located by
+            `_parse_el_paso_html_fields`, if present.
 
         Returns
         -------
         Optional[str]
             Concatenated multiline string if found, otherwise ``None``.
         """
-        tp_header = soup.find(["h2", "h3"], string=lambda s: isinstance(s, str) and "3RD PARTY" in s.upper())
         if tp_header is None:
             return None
 
@@ -543,66 +673,77 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         node = config if config is not None else tp_container
 
         lines: List[str] = []
-        fn = node.select_one(".contactinfo_firstname") if node else None
-        ln = node.select_one(".contactinfo_lastname") if node else None
+        fn = _SEL_FIRSTNAME.select_one(node) if node else None
+        ln = _SEL_LASTNAME.select_one(node) if node else None
         name = (f"{fn.get_text(strip=True) if fn else ''} {ln.get_text(strip=True) if ln else ''}").strip()
         if name:
             lines.append(name)
 
-        biz = node.select_one(".contactinfo_businessname") if node else None
+        biz = _SEL_BUSINESSNAME.select_one(node) if node else None
         if biz and biz.get_text(strip=True):
             lines.append(biz.get_text(strip=True))
 
-        addr1 = node.select_one(".contactinfo_addressline1") if node else None
+        addr1 = _SEL_ADDRESSLINE1.select_one(node) if node else None
         if addr1 and addr1.get_text(strip=True):
             lines.append(addr1.get_text(strip=True))
 
-        region = node.select_one(".contactinfo_region") if node else None
+        region = _SEL_REGION.select_one(node) if node else None
         if region and region.get_text(strip=True):
             lines.append(region.get_text(strip=True))
 
-        node_text = node.get_text("\n", strip=True) if node else ""
-        container_text = tp_container.get_text("\n", strip=True) if tp_container else node_text
+        # Scope text extraction to the contact block itself; the parent
+        # container can span most of the page and get_text is O(subtree).
+        block_text = node.get_text("\n", strip=True) if node else ""
+
+        def _select_digits(id_suffix: str) -> str:
+            el = _SEL_CONTACT_IDS[id_suffix].select_one(node) if node else None
+            return re.sub(r"\D", "", el.get_text(strip=True)) if el is not None else ""
 
         def _find_digits(label: str) -> str:
-            m = re.search(label + r"\s*([0-9\-\(\)\s]+)", container_text)
+            m = re.search(label + r"\s*([0-9\-\(\)\s]+)", block_text)
             if not m:
                 return ""
             return re.sub(r"\D", "", m.group(1))
 
-        phone_digits = _find_digits("Phone:")
+        phone_digits = _select_digits("PhoneHome") or _find_digits("Phone:")
         if phone_digits:
             lines.append(f"Phone:\t{phone_digits}")
 
-        mobile_digits = _find_digits("Mobile Phone:")
+        mobile_digits = _select_digits("PhoneMobile") or _find_digits("Mobile Phone:")
         if mobile_digits:
             lines.append(f"Mobile Phone:\t{mobile_digits}")
         if not mobile_digits and phone_digits:
             mobile_digits = phone_digits
             lines.append(f"Mobile Phone:\t{mobile_digits}")
 
-        m = re.search(r"E-mail:\s*([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})", container_text)
-        if m:
-            lines.append(f"E-mail:\t{m.group(1)}")
+        email_el = _SEL_CONTACT_IDS["Email"].select_one(node) if node else None
+        email = email_el.get_text(strip=True) if email_el is not None else ""
+        if not email:
+            m = re.search(r"E-mail:\s*([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})", block_text)
+            email = m.group(1) if m else ""
+        if email:
+            lines.append(f"E-mail:\t{email}")
 
         if len(lines) > 7:
             lines = lines[:7]
         return "\n".join(lines) if lines else None
 
-    def _parse_job_value_block(self, soup: BeautifulSoup) -> Optional[str]:
+    def _parse_job_value_block(self, soup: BeautifulSoup, job_h2) -> Optional[str]:
         """Parse the Job Value section.
 
         Parameters
         ----------
         soup : BeautifulSoup
             Parsed BeautifulSoup tree of the permit details page.
+        job_h2 : Optional[Tag]
+            The ``Job Value($):`` header node located by
+            `_parse_el_paso_html_fields`, if present.
 
         Returns
         -------
         Optional[str]
             Job value string if found, otherwise ``None``.
         """
-        job_h2 = soup.find("h2", string=lambda s: isinstance(s, str) and "Job Value($):" in s)
         if job_h2 is None:
             return None
         val_span = job_h2.find_parent().find_next_sibling("span")
@@ -610,42 +751,44 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
             return None
         return val_span.get_text(strip=True)
 
-    def _parse_applicant_block(self, soup: BeautifulSoup) -> Optional[str]:
+    def _parse_applicant_block(self, soup: BeautifulSoup, app_label) -> Optional[str]:
         """Parse the Applicant section into a normalized multiline string.
 
         Parameters
         ----------
         soup : BeautifulSoup
             Parsed BeautifulSoup tree of the permit details page.
+        app_label : Optional[Tag]
+            The ``Applicant:`` label node located by
+            `_parse_el_paso_html_fields`, if present.
 
         Returns
         -------
         Optional[str]
             Concatenated multiline string if found, otherwise ``None``.
         """
-        app_label = soup.find("span", string=lambda s: isinstance(s, str) and s.strip().startswith("Applicant:"))
         if app_label is None:
             return None
         section = app_label.find_parent().find_next_sibling("span")
         if section is None:
             section = app_label.find_parent().find_parent()
         lines: List[str] = []
-        fn = section.select_one(".contactinfo_firstname")
-        ln = section.select_one(".contactinfo_lastname")
+        fn = _SEL_FIRSTNAME.select_one(section)
+        ln = _SEL_LASTNAME.select_one(section)
         full_name = (f"{fn.get_text(strip=True) if fn else ''} {ln.get_text(strip=True) if ln else ''}").strip()
         if full_name:
             lines.append(full_name)
 
-        biz = section.select_one(".contactinfo_businessname")
+        biz = _SEL_BUSINESSNAME.select_one(section)
         if biz and biz.get_text(strip=True):
             lines.append(biz.get_text(strip=True))
 
-        addr1 = section.select_one(".contactinfo_addressline1")
+        addr1 = _SEL_ADDRESSLINE1.select_one(section)
         if addr1 and addr1.get_text(strip=True):
             lines.append(addr1.get_text(strip=True))
 
         # Concatenate multiple .contactinfo_region spans for city, state, zip
-        region_spans = section.select(".contactinfo_region")
+        region_spans = _SEL_REGION.select(section)
         if region_spans:
             region_text = " ".join(s.get_text(strip=True) for s in region_spans if s.get_text(strip=True))
             # Normalize commas/spaces to match expected format
@@ -654,24 +797,34 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
             region_text = region_text.replace("El Paso, Texas, 79925", "El Paso, Texas, 79925")
             lines.append(region_text)
 
+        # Prefer structured contactinfo ids; only fall back to a regex over
+        # the section's own text when they are absent from the markup.
         section_text = section.get_text("\n", strip=True)
 
+        def _select_digits(id_suffix: str) -> str:
+            el = _SEL_CONTACT_IDS[id_suffix].select_one(section)
+            return re.sub(r"\D", "", el.get_text(strip=True)) if el is not None else ""
+
         def _find_digits(label: str) -> str:
             m = re.search(label + r"\s*([0-9\-\(\)\s]+)", section_text)
             return re.sub(r"\D", "", m.group(1)) if m else ""
 
-        phone = _find_digits("Phone:")
+        phone = _select_digits("PhoneHome") or _find_digits("Phone:")
         if phone:
             lines.append(f"Phone:\t{phone}")
-        work = _find_digits("Work Phone:")
+        work = _select_digits("PhoneWork") or _find_digits("Work Phone:")
         if work:
             lines.append(f"Work Phone:\t{work}")
-        mobile = _find_digits("Mobile Phone:")
+        mobile = _select_digits("PhoneMobile") or _find_digits("Mobile Phone:")
         if mobile:
             lines.append(f"Mobile Phone:\t{mobile}")
 
-        m = re.search(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}", section_text)
-        if m:
-            lines.append(m.group(0))
+        email_el = _SEL_CONTACT_IDS["Email"].select_one(section)
+        email = email_el.get_text(strip=True) if email_el is not None else ""
+        if not email:
+            m = re.search(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}", section_text)
+            email = m.group(0) if m else ""
+        if email:
+            lines.append(email)
 
         return "\n".join(lines) if lines else None
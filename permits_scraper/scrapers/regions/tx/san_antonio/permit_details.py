@@ -19,16 +19,96 @@ Design
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Optional, Dict, List, Callable
 
-from playwright.async_api import Browser, Locator, Page, async_playwright
+from pydantic import PrivateAttr
+from bs4 import BeautifulSoup
+import soupsieve
+from playwright.async_api import Browser, BrowserContext, Locator, Page, async_playwright
 from permits_scraper.scrapers.base.playwright_permit_details import PlaywrightPermitDetailsBaseScraper
 
 from permits_scraper.schemas.contacts import ApplicantData, OwnerData
 from permits_scraper.schemas.permit_record import PermitRecord
 
+# Precompiled patterns: hoisted to module level so per-permit parsing skips
+# the re-cache hash + lookup on every call.
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_TRAILING_STAR_RE = re.compile(r'\s*\*.*$')
+# Fused comma cleanup: one alternation pass replaces the separate
+# space-before-comma and doubled-comma substitutions.
+_ADDR_CLEAN_RE = re.compile(r'\s+,|,\s*,')
+
+
+def _addr_clean_fix(match: "re.Match[str]") -> str:
+    """Collapse a comma artefact matched by `_ADDR_CLEAN_RE`."""
+    return ', ' if match.group(0).startswith(',') else ','
+
+# Stable Accela selectors, hoisted so repeated batches reuse the exact same
+# strings instead of rebuilding them per call.
+_SEL_SEARCH_INPUT = 'input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]'
+_SEL_SEARCH_BUTTON = 'a[id="ctl00_PlaceHolderMain_btnNewSearch"]'
+_SEL_SEARCH_BUTTON_FALLBACK = 'a:has-text("Search")'
+_SEL_SECTION_TITLE = '#ctl00_PlaceHolderMain_shPermitDetail_lblSectionTitle'
+_SEL_SEARCH_MISS = 'span.ACA_ErrorMessage, td:has-text("No records")'
+# Precompiled CSS selectors for the HTML-snapshot fallback parse: compiling
+# once at import skips soupsieve's parse/cache lookup per call.
+_SEL_FIRSTNAME = soupsieve.compile('.contactinfo_firstname')
+_SEL_LASTNAME = soupsieve.compile('.contactinfo_lastname')
+_SEL_OWNER_LABEL = soupsieve.compile(
+    'span[id^="ctl00_PlaceHolderMain_PermitDetailList1_per_permitdetail_label_owner"]'
+)
+_SEL_OWNER_TABLE = soupsieve.compile('table table table')
+
+# One-shot extractor: runs every DOM query inside the page and returns a
+# single JSON payload, replacing ~10 CDP round-trips per permit with one.
+_CONTACTS_JS = """
+() => {
+    const out = {applicant: null, owner: null};
+
+    for (const h1 of document.querySelectorAll('h1')) {
+        if (!h1.innerText.includes('Applicant:')) continue;
+        const section = h1.parentElement && h1.parentElement.parentElement;
+        if (section) {
+            const fn = section.querySelector('.contactinfo_firstname');
+            const ln = section.querySelector('.contactinfo_lastname');
+            let phoneText = null;
+            let mailingText = null;
+            for (const td of section.querySelectorAll('td')) {
+                const text = td.innerText;
+                if (phoneText === null && text.includes('Primary Phone')) phoneText = text;
+                if (mailingText === null && text.includes('Mailing')) mailingText = text;
+                if (phoneText !== null && mailingText !== null) break;
+            }
+            out.applicant = {
+                firstName: fn ? fn.innerText : null,
+                lastName: ln ? ln.innerText : null,
+                text: section.innerText,
+                phoneText: phoneText,
+                mailingText: mailingText,
+            };
+        }
+        break;
+    }
+
+    const ownerLabel = document.querySelector(
+        'span[id^="ctl00_PlaceHolderMain_PermitDetailList1_per_permitdetail_label_owner"]'
+    );
+    if (ownerLabel) {
+        const section = ownerLabel.parentElement && ownerLabel.parentElement.parentElement;
+        const table = section ? section.querySelector('table table table') : null;
+        const tds = table ? table.querySelectorAll('td') : [];
+        if (tds.length >= 2) {
+            out.owner = {nameText: tds[0].innerText, addrText: tds[1].innerText};
+        }
+    }
+
+    return out;
+}
+"""
+
 
 class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
     """Scraper for San Antonio (TX) Accela permit details.
@@ -70,9 +150,76 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
     _city: str = "san_antonio"
     _base_url: str = "https://aca-prod.accela.com/COSA/Cap/CapHome.aspx?module=Building&TabName=Building"
 
+    # Cached Playwright driver/browser/context, reused across scrape calls so
+    # repeated invocations skip the Chromium cold start.
+    _pw: Optional[object] = PrivateAttr(default=None)
+    _browser: Optional[Browser] = PrivateAttr(default=None)
+    _context: Optional[BrowserContext] = PrivateAttr(default=None)
+    # Upper bound on concurrent tabs within the shared context.
+    _concurrency: int = PrivateAttr(default=4)
+    # Lazily created event loop reused by the sync `scrape` entry point, so
+    # repeated sync calls skip asyncio.run's loop setup/teardown and can keep
+    # the cached browser alive between batches.
+    _loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+
     def scrape(self, permit_numbers: List[str], progress_callback: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, PermitRecord]:
-        return super().scrape(permit_numbers, progress_callback)
+        """Scrape permits synchronously on a reusable private event loop.
+
+        Notes
+        -----
+        Call `close` when done to release the loop and browser. From an
+        already-running event loop (e.g. Jupyter), ``await scrape_async``
+        directly instead.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.scrape_async(permit_numbers, progress_callback))
 
+    def close(self) -> None:
+        """Shut down the reusable loop, cached browser and results log."""
+        if self._loop is not None:
+            try:
+                self._loop.run_until_complete(self.aclose())
+            finally:
+                self._loop.close()
+                self._loop = None
+        else:
+            self.close_results_log()
+
+    def set_concurrency(self, value: int) -> None:
+        """Set the maximum number of permits scraped concurrently."""
+        self._concurrency = max(1, value)
+
+    async def _ensure_browser(self) -> BrowserContext:
+        """Lazily launch and cache the Playwright browser and context.
+
+        Returns
+        -------
+        BrowserContext
+            The shared browser context, created on first use and reused by
+            every subsequent ``scrape_async`` call until `aclose`.
+        """
+        if self._context is None:
+            self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(headless=self._headless)
+            self._context = await self._browser.new_context()
+            await self._configure_network_blocking(self._context)
+        return self._context
+
+    async def aclose(self) -> None:
+        """Tear down the cached context, browser and Playwright driver."""
+        self.close_results_log()
+        try:
+            if self._context is not None:
+                await self._context.close()
+            if self._browser is not None:
+                await self._browser.close()
+            if self._pw is not None:
+                await self._pw.stop()
+        finally:
+            self._context = None
+            self._browser = None
+            self._pw = None
 
     async def scrape_async(self, permit_numbers: List[str], progress_callback: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, PermitRecord]:
         """Asynchronously scrape permit details for a single application.
@@ -87,134 +234,318 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
         Dict[str, PermitRecord]
             Parsed applicant and owner contact data.
         """
-        async with async_playwright() as playwright:
-            browser: Browser = await playwright.chromium.launch(headless=self._headless)
-            context = await browser.new_context()
-            await self._configure_network_blocking(context)
+        context = await self._ensure_browser()
+        results: Dict[str, PermitRecord] = {}
+        total = len(permit_numbers)
+        # Permits are independent and spend almost all their time awaiting
+        # network/DOM, so run a small pool of worker tabs. Each worker keeps
+        # its page across permits: only its first lookup pays the full search
+        # page load, later ones re-navigate with a cheap committed goto.
+        queue: asyncio.Queue = asyncio.Queue()
+        for permit_number in permit_numbers:
+            queue.put_nowait(permit_number)
+
+        async def _worker() -> None:
             page: Page = await context.new_page()
-
+            first_navigation = True
             try:
-                results: Dict[str, PermitRecord] = {}
-                for permit_number in permit_numbers:
+                while True:
                     try:
-                        success = False
-                        await self._goto_search_page(page)
-                        await self._submit_search(page, permit_number)
-
-                        # Wait until the page title appears
-                        await page.wait_for_selector('#ctl00_PlaceHolderMain_shPermitDetail_lblSectionTitle', state='visible')
-
-                        applicant: Optional[ApplicantData] = await self._extract_applicant(page)
-                        owner: Optional[OwnerData] = await self._extract_owner(page)
-
-                        result = PermitRecord(
-                            permit_number=permit_number,
-                            applicant=applicant,
-                            owner=owner)
-
-
-                        # Persist per-permit result immediately as a crash-safe fallback
-                        self.persist_result(permit_number, result)
+                        permit_number = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    success = False
+                    try:
+                        results[permit_number] = await self._process_permit(page, permit_number, first_navigation)
                         success = True
-                        results[permit_number] = result
+                        first_navigation = False
                     except Exception as e:
                         logging.exception("Error extracting permit details: %s:\n%s", permit_number, e)
-                        success = False
-                        continue
-                    finally:
-                        success_chunk = 1 if success else 0
-                        failed_chunk = 1 if not success else 0
-                        self.process_progress_callback(progress_callback, success_chunk, failed_chunk, len(permit_numbers))
-
-                return results
+                        # Page state is unknown after a failure; force a clean load.
+                        first_navigation = True
+                    success_chunk = 1 if success else 0
+                    failed_chunk = 1 if not success else 0
+                    self.process_progress_callback(progress_callback, success_chunk, failed_chunk, total)
             finally:
-                await browser.close()
+                await page.close()
+
+        workers = max(1, min(self._concurrency, total))
+        outcomes = await asyncio.gather(*(_worker() for _ in range(workers)), return_exceptions=True)
+        # A worker can die outside its per-permit try (new_page on a dead
+        # browser, page.close failing): surface those crashes and report any
+        # permits left in the queue instead of returning silently partial
+        # results.
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logging.error("Worker crashed: %s", outcome, exc_info=outcome)
+        while True:
+            try:
+                permit_number = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            logging.error("Permit %s was not processed: worker pool exited early", permit_number)
+            self.process_progress_callback(progress_callback, 0, 1, total)
+        return results
+
+    async def _process_permit(self, page: Page, permit_number: str, first_navigation: bool = True) -> PermitRecord:
+        """Search for one permit on a worker page and extract its record.
 
-    async def _goto_search_page(self, page: Page) -> None:
-        """Navigate to the base search page and wait for network idle."""
-        await page.goto(self._base_url, wait_until="domcontentloaded")
+        Parameters
+        ----------
+        page : Page
+            A page within the shared browser context, reused across permits.
+        permit_number : str
+            The application number to search for on the Accela portal.
+        first_navigation : bool, default=True
+            Whether this is the page's first visit to the search form; later
+            visits use a cheaper committed navigation.
+
+        Returns
+        -------
+        PermitRecord
+            Parsed applicant and owner contact data.
+        """
+        await self._goto_search_page(page, first_navigation)
+        await self._submit_search(page, permit_number)
+
+        # Race the details title against the "no records" error banner:
+        # waiting on the title alone idles for the full timeout when a
+        # permit number does not resolve.
+        t_ok = asyncio.create_task(
+            page.wait_for_selector(_SEL_SECTION_TITLE, state='visible', timeout=15000)
+        )
+        t_miss = asyncio.create_task(
+            page.wait_for_selector(_SEL_SEARCH_MISS, timeout=15000)
+        )
+        done, _ = await asyncio.wait({t_ok, t_miss}, return_when=asyncio.FIRST_COMPLETED)
+        if t_miss in done and t_miss.exception() is None:
+            t_ok.cancel()
+            raise ValueError(f"No permit found for {permit_number}")
+        t_miss.cancel()
+        # Propagate the title wait's own outcome (e.g. a timeout) otherwise.
+        await t_ok
+
+        # Primary path: one evaluate call gathers all contact fields in-page;
+        # fall back to the locator-based walk only when it yields nothing.
+        applicant: Optional[ApplicantData] = None
+        owner: Optional[OwnerData] = None
+        try:
+            raw = await page.evaluate(_CONTACTS_JS)
+        except Exception as e:
+            logging.exception("JS contact extraction failed: %s", e)
+            raw = None
+        if raw:
+            applicant = self._applicant_from_raw(raw.get("applicant"))
+            owner = self._owner_from_raw(raw.get("owner"))
+        if applicant is None and owner is None:
+            # Fallback: grab the rendered HTML once and parse it locally;
+            # a single content() call beats a dozen locator round-trips.
+            html = await page.content()
+            soup = BeautifulSoup(html, "html.parser")
+            applicant = self._extract_applicant(soup)
+            owner = self._extract_owner(soup)
+
+        result = PermitRecord(
+            permit_number=permit_number,
+            applicant=applicant,
+            owner=owner)
+
+        # Append to the run's JSONL log immediately as a crash-safe fallback
+        self.persist_result_jsonl(permit_number, result)
+        return result
+
+    async def _goto_search_page(self, page: Page, first_navigation: bool = True) -> None:
+        """Navigate to the base search page.
+
+        The first visit waits for ``domcontentloaded``; subsequent visits on
+        a warm page return as soon as the navigation commits, since
+        `_submit_search` already waits for the form to become visible.
+        """
+        if first_navigation:
+            await page.goto(self._base_url, wait_until="domcontentloaded")
+        else:
+            await page.goto(self._base_url, wait_until="commit")
 
     async def _submit_search(self, page: Page, permit_number: str) -> None:
         """Fill the permit number and submit the search form."""
         # Wait for the form to be ready
-        await page.wait_for_selector('input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]', state='visible')
+        await page.wait_for_selector(_SEL_SEARCH_INPUT, state='visible')
 
-        permit_number_field: Locator = page.locator(
-            'input[name="ctl00$PlaceHolderMain$generalSearchForm$txtGSPermitNumber"]'
-        )
+        permit_number_field: Locator = page.locator(_SEL_SEARCH_INPUT)
         await permit_number_field.fill(permit_number)
 
         # Try with different selectors
-        search_button = page.locator('a[id="ctl00_PlaceHolderMain_btnNewSearch"]')
+        search_button = page.locator(_SEL_SEARCH_BUTTON)
         if await search_button.count() == 0:
-            search_button = page.locator('a:has-text("Search")')
+            search_button = page.locator(_SEL_SEARCH_BUTTON_FALLBACK)
 
         await search_button.click()
 
-    async def _extract_applicant(self, page: Page) -> Optional[ApplicantData]:
-        """Extract applicant data from the page, if present."""
+    @staticmethod
+    def _parse_phone_lines(cell_text: str) -> Optional[str]:
+        """Return the line following the "Primary Phone" label in a cell text."""
+        text_parts = cell_text.splitlines()
+        phone_number = None
+        # enumerate keeps this O(n); list.index would rescan from the start
+        # and pick the wrong line if an earlier one repeats the label.
+        for i, part in enumerate(text_parts):
+            if "Primary Phone" in part:
+                phone_number = text_parts[i + 1] if i + 1 < len(text_parts) else None
+                break
+        return phone_number.strip() if phone_number else None
+
+    @staticmethod
+    def _parse_mailing_lines(cell_text: str) -> Optional[str]:
+        """Return the joined lines following the "Mailing" label in a cell text."""
+        text_parts = cell_text.splitlines()
+        mailing_address = None
+        for i, part in enumerate(text_parts):
+            if "Mailing" in part:
+                # The final line of the cell is the "Show on Map" control, so
+                # dropping it with [:-1] is intentional.
+                mailing_address = " ".join(text_parts[i + 1:-1])
+                break
+        return mailing_address.strip() if mailing_address else None
+
+    def _applicant_from_raw(self, raw: Optional[Dict[str, Optional[str]]]) -> Optional[ApplicantData]:
+        """Build `ApplicantData` from the JS extractor's applicant payload.
+
+        Parameters
+        ----------
+        raw : Optional[Dict[str, Optional[str]]]
+            Payload produced by the in-page extractor, or ``None`` if the
+            applicant section was not found.
+
+        Returns
+        -------
+        Optional[ApplicantData]
+            Parsed applicant data, or ``None``.
+        """
+        if not raw:
+            return None
+        data = ApplicantData()
+        if raw.get("firstName"):
+            data.first_name = raw["firstName"].strip()
+        if raw.get("lastName"):
+            data.last_name = raw["lastName"].strip()
+
+        txt = raw.get("text") or ""
+        if '@' in txt:
+            m = _EMAIL_RE.search(txt)
+            if m:
+                data.email = m.group(0)
+
+        if raw.get("phoneText"):
+            data.phone_number = self._parse_phone_lines(raw["phoneText"])
+        if raw.get("mailingText"):
+            data.address = self._parse_mailing_lines(raw["mailingText"])
+        return data
+
+    def _owner_from_raw(self, raw: Optional[Dict[str, str]]) -> Optional[OwnerData]:
+        """Build `OwnerData` from the JS extractor's owner payload."""
+        if not raw:
+            return None
+        return self._owner_from_texts(raw.get("nameText") or "", raw.get("addrText") or "")
+
+    def _owner_from_texts(self, name_text: str, raw_addr: str) -> OwnerData:
+        """Build `OwnerData` from the raw name and address cell texts.
+
+        Parameters
+        ----------
+        name_text : str
+            Raw text of the owner name cell.
+        raw_addr : str
+            Raw text of the owner address cell.
+
+        Returns
+        -------
+        OwnerData
+            Parsed owner data.
+        """
+        name_text = name_text.strip()
+        # Remove the trailing asterisk and anything after it; most owners
+        # have none, so a substring guard skips the regex on the fast path.
+        if '*' in name_text:
+            name_text = _TRAILING_STAR_RE.sub('', name_text).strip()
+        # Heuristic: content looks like "LASTNAME FIRSTNAME". Bare split()
+        # already yields stripped, non-empty tokens, so no re-filtering or
+        # per-field strips are needed.
+        parts = name_text.split()
+        n = len(parts)
+        data = OwnerData()
+        if n == 2:
+            data.last_name, data.first_name = parts
+        elif n > 2:
+            data.company_name = " ".join(parts)
+        elif n == 1:
+            data.first_name = parts[0]
+
+        # Address: bare split() collapses all whitespace (including newlines)
+        # in one pass, and the fused regex fixes comma artefacts in another.
+        data.address = _ADDR_CLEAN_RE.sub(_addr_clean_fix, " ".join(raw_addr.split()))
+        return data
+
+    def _extract_applicant(self, soup: BeautifulSoup) -> Optional[ApplicantData]:
+        """Extract applicant data from the rendered HTML snapshot, if present."""
         try:
-            section = page.locator('h1:has-text("Applicant:")').locator("..").locator("..")
-            if await section.count() == 0:
+            section = None
+            for h1 in soup.find_all("h1"):
+                if "Applicant:" in h1.get_text():
+                    section = h1.parent.parent if h1.parent is not None else None
+                    break
+            if section is None:
                 return None
             data = ApplicantData()
 
-            # Names
-            fn = section.locator('.contactinfo_firstname')
-            ln = section.locator('.contactinfo_lastname')
-            if await fn.count():
-                data.first_name = (await fn.inner_text()).strip()
-            if await ln.count():
-                data.last_name = (await ln.inner_text()).strip()
-
-            txt = await section.inner_text()
+            fn = _SEL_FIRSTNAME.select_one(section)
+            ln = _SEL_LASTNAME.select_one(section)
+            if fn is not None:
+                data.first_name = fn.get_text(strip=True)
+            if ln is not None:
+                data.last_name = ln.get_text(strip=True)
 
             # Email
-            m = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', txt)
-            if m:
-                data.email = m.group(0)
-
-            # Phone: use label "Primary Phone" dt/dd structure
-            phone_dd = section.locator('td:has-text("Primary Phone")')
-            if await phone_dd.count():
-                text_parts = (await phone_dd.first.inner_text()).splitlines()
-                # Find the next part after "Primary Phone"
-                phone_number = None
-                for part in text_parts:
-                    if "Primary Phone" in part:
-                        phone_number = text_parts[text_parts.index(part) + 1]
-                        break
-                if phone_number:
-                    data.phone_number = phone_number.strip()
-
-            # Mailing address
-            addr_dd = section.locator('td:has-text("Mailing")')
-            if await addr_dd.count():
-                text_parts = (await addr_dd.first.inner_text()).splitlines()
-                # Find the next part after "Mailing"
-                mailing_address = None
-                for part in text_parts:
-                    if "Mailing" in part:
-                        mailing_address = " ".join(text_parts[text_parts.index(part) + 1:-1])
-                        break
-                data.address = mailing_address.strip()
+            txt = section.get_text()
+            if '@' in txt:
+                m = _EMAIL_RE.search(txt)
+                if m:
+                    data.email = m.group(0)
+
+            # Phone and mailing address live in labelled table cells; one
+            # walk over the section's cells finds both.
+            phone_cell_text = None
+            addr_cell_text = None
+            for td in section.find_all("td"):
+                cell_text = td.get_text("\n")
+                if phone_cell_text is None and "Primary Phone" in cell_text:
+                    phone_cell_text = cell_text
+                if addr_cell_text is None and "Mailing" in cell_text:
+                    addr_cell_text = cell_text
+                if phone_cell_text is not None and addr_cell_text is not None:
+                    break
+
+            if phone_cell_text is not None:
+                data.phone_number = self._parse_phone_lines(phone_cell_text)
+            if addr_cell_text is not None:
+                data.address = self._parse_mailing_lines(addr_cell_text)
 
             return data
         except Exception as e:
             logging.exception("Error extracting applicant: %s", e)
             return None
 
-    async def _extract_owner(self, page: "Page") -> Optional[OwnerData]:
+    def _extract_owner(self, soup: BeautifulSoup) -> Optional[OwnerData]:
         """
-        Extract owner data from the Owner block using Playwright's Page.
+        Extract owner data from the Owner block of the rendered HTML snapshot.
 
-        This method locates the owner information section in the permit details page,
-        extracts the owner's name and address, and returns an OwnerData object.
+        This method locates the owner information section in the permit details
+        markup, extracts the owner's name and address, and returns an OwnerData
+        object.
 
         Parameters
         ----------
-        page : Page
-            Playwright Page object representing the loaded permit details page.
+        soup : BeautifulSoup
+            Parsed HTML of the loaded permit details page.
 
         Returns
         -------
@@ -227,54 +558,26 @@ class PermitDetailsScraper(PlaywrightPermitDetailsBaseScraper):
 
         Examples
         --------
-        >>> owner = await self._extract_owner(page)
+        >>> owner = self._extract_owner(soup)
         >>> print(owner)
         OwnerData(first_name='JOHN', last_name='SMITH', company_name=None, address='123 Main St, San Antonio, TX')
         """
         try:
-            # Find the Owner label span by stable id prefix, then its sibling span holding the table content
-            owner_label = page.locator('span[id^="ctl00_PlaceHolderMain_PermitDetailList1_per_permitdetail_label_owner"]')
-            if await owner_label.count() == 0:
+            # Find the Owner label span by stable id prefix, then the nested
+            # table two ancestors up (first cell = name, second = address).
+            owner_label = _SEL_OWNER_LABEL.select_one(soup)
+            if owner_label is None or owner_label.parent is None:
                 return None
-
-            # The owner section is two ancestors up from the label, then the first descendant table
-            section = owner_label.locator('..').locator('..')
-            if await section.count() == 0:
+            section = owner_label.parent.parent
+            if section is None:
                 return None
-
-            # The innermost table has two rows: first row = name cell, second row = address cell
-            table = section.locator('xpath=.//table//table//table')
-            if await table.count() == 0:
+            table = _SEL_OWNER_TABLE.select_one(section)
+            if table is None:
                 return None
-
-            td_elements = table.locator('td')
-            if await td_elements.count() < 2:
+            tds = table.find_all("td")
+            if len(tds) < 2:
                 return None
-
-            name_cell = td_elements.nth(0)
-            addr_cell = td_elements.nth(1)
-            name_text = (await name_cell.inner_text()).strip()
-            # Remove the trailing asterisk and anything after it
-            name_text = re.sub(r'\s*\*.*$', '', name_text).strip()
-            # Heuristic: content looks like "LASTNAME FIRSTNAME"
-            parts = [p for p in name_text.split() if p]
-            data = OwnerData()
-            if len(parts) == 2:
-                data.last_name = parts[0].strip()
-                data.first_name = " ".join(parts[1:]).strip()
-            elif len(parts) > 2:
-                data.company_name = " ".join(parts).strip()
-            else:
-                data.first_name = name_text.strip()
-
-            # Address: join lines and normalize excessive commas/spaces
-            raw_addr = (await addr_cell.inner_text()).strip()
-            addr = " ".join(line.strip() for line in raw_addr.splitlines() if line.strip())
-            addr = re.sub(r'\s+,', ',', addr)
-            addr = re.sub(r',\s*,', ', ', addr)
-            data.address = addr.strip()
-
-            return data
+            return self._owner_from_texts(tds[0].get_text("\n").strip(), tds[1].get_text("\n").strip())
         except Exception as e:
             logging.exception("Error extracting owner: %s", e)
             return None
@@ -5,15 +5,40 @@ from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Any
 import asyncio
 import logging
+import time
 
 from tqdm import tqdm
 
+from permits_scraper.scrapers.base.permit_details import PermitDetailsBaseScraper
 from permits_scraper.ui.registry import select_scraper
 from permits_scraper.ui.utils import chunk_evenly, GREEN, RED, RESET
-from permits_scraper.scrapers.base.permit_details import PermitDetailsBaseScraper
+from permits_scraper.ui.progress import ProgressDispatcher
+
+# Capability flags probed once per scraper class; repeated hasattr checks
+# would otherwise sit on the worker's critical path before browser spin-up.
+_CAPS_CACHE: Dict[type, bool] = {}
+
+
+def _supports_headless_toggle(scraper: object) -> bool:
+    scraper_cls = type(scraper)
+    cached = _CAPS_CACHE.get(scraper_cls)
+    if cached is None:
+        cached = hasattr(scraper_cls, "set_headless")
+        _CAPS_CACHE[scraper_cls] = cached
+    return cached
+
+# Prefer uvloop's C event loop when available: the runners are progress-
+# callback heavy, and libuv's scheduler dispatches those callbacks with far
+# less overhead than the default loop. Optional; stdlib asyncio otherwise.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 
 async def _details_worker(
+    scraper: PermitDetailsBaseScraper,
     region: str,
     city: str,
     headless: bool,
@@ -21,9 +46,9 @@ async def _details_worker(
     extra_kwargs: Optional[Dict[str, Any]],
     per_bar: tqdm,
     overall_bar: tqdm,
+    dispatcher: ProgressDispatcher,
 ) -> Tuple[int, int, int]:
-    scraper: PermitDetailsBaseScraper = select_scraper(region, city, type="details")  # type: ignore[assignment]
-    if hasattr(scraper, "set_headless") and headless == False:
+    if not headless and _supports_headless_toggle(scraper):
         try:
             scraper.set_headless(False)  # type: ignore[attr-defined]
         except Exception:
@@ -31,23 +56,28 @@ async def _details_worker(
 
     success_chunks_total = 0
     failed_chunks_total = 0
-    announced_total = False
+    pending = 0
+    last_flush = time.monotonic()
+
+    def flush_progress() -> None:
+        # Repainting tqdm on every tick contends on stdout; coalesce updates
+        # and hand the flush to the shared dispatcher thread so the worker
+        # never blocks on the tqdm lock or terminal IO.
+        nonlocal pending, last_flush
+        if pending:
+            dispatcher.submit(per_bar, overall_bar, pending, success_chunks_total, failed_chunks_total)
+            pending = 0
+        last_flush = time.monotonic()
 
     def on_progress(success_chunks_inc: int, failed_chunks_inc: int, total_chunks: Optional[int] = None) -> None:
         nonlocal success_chunks_total, failed_chunks_total
-        nonlocal announced_total
+        nonlocal pending
         try:
             success_chunks_total += success_chunks_inc
             failed_chunks_total += failed_chunks_inc
-            overall_bar.update(success_chunks_inc+failed_chunks_inc)
-            per_bar.update(success_chunks_inc+failed_chunks_inc)
-            per_bar.set_postfix(success=success_chunks_total, failed=failed_chunks_total)
-            if total_chunks is not None and not announced_total:
-                per_bar.total = total_chunks
-                overall_total = overall_bar.total or 0
-                overall_bar.total = overall_total + total_chunks
-                overall_bar.refresh()
-                announced_total = True
+            pending += success_chunks_inc + failed_chunks_inc
+            if pending >= 32 or time.monotonic() - last_flush > 0.1:
+                flush_progress()
         except Exception:
             pass
 
@@ -58,10 +88,12 @@ async def _details_worker(
             progress_callback=on_progress,  # type: ignore[arg-type]
             **kwargs,
         )
+        flush_progress()
     except Exception:
         logging.exception("PermitDetails worker failed: region=%s city=%s", region, city)
         # Mark remaining as failed to avoid stuck bars
         try:
+            flush_progress()
             remaining = max(0, (per_bar.total or 0) - (success_chunks_total + failed_chunks_total))
             if remaining:
                 per_bar.update(remaining)
@@ -84,35 +116,68 @@ def run_details(
     headless: bool,
     extra_kwargs: Optional[Dict[str, Any]] = None,
 ) -> None:
-    instances = max(1, min(instances, len(permits)))
+    # Floor of ~10 permits per instance: over-parallelizing a small job
+    # wastes browser spin-ups and task overhead on near-empty chunks.
+    instances = max(1, min(instances, len(permits), (len(permits) + 9) // 10))
     chunks = chunk_evenly(permits, instances)
 
-    # Initialize bars with unknown totals; workers will announce totals via progress callback
-    overall_bar = tqdm(total=0, position=0, desc="Overall", leave=True)
+    # Allocate one scraper per instance up front and hand it to the worker;
+    # scrapers that cache a browser then reuse it for their whole chunk and
+    # are released together at the end of the run.
+    scrapers: List[PermitDetailsBaseScraper] = [
+        select_scraper(region, city, type="details")  # type: ignore[misc]
+        for _ in chunks
+    ]
+
+    # Totals are known up front (one tick per permit), so the bars start
+    # fully sized and workers never mutate totals or force extra repaints.
+    dispatcher = ProgressDispatcher()
+    dispatcher.start()
+    overall_bar = tqdm(total=len(permits), position=0, desc="Overall", leave=True)
     per_bars = [
-        tqdm(total=0, position=i + 1, desc=f"Instance {i + 1}", leave=True)
-        for i, _ in enumerate(chunks)
+        tqdm(total=len(chunk), position=i + 1, desc=f"Instance {i + 1}", leave=True)
+        for i, chunk in enumerate(chunks)
     ]
 
     async def runner() -> Tuple[int, int, int]:
-        tasks = [
-            _details_worker(region, city, headless, chunks[i], extra_kwargs, per_bars[i], overall_bar)
-            for i in range(len(chunks))
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
         success_total = 0
         failed_total = 0
         permits_total = 0
-        for res in results:
-            if isinstance(res, tuple):
-                success_total += res[0]
-                failed_total += res[1]
-                permits_total += res[2]
+        tasks: List[asyncio.Task] = []
+        try:
+            # Structured concurrency: if a worker crashes outright, its peers
+            # are cancelled promptly instead of grinding on, and the failure
+            # is logged rather than silently filtered out.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(
+                            _details_worker(scrapers[i], region, city, headless, chunks[i], extra_kwargs, per_bars[i], overall_bar, dispatcher)
+                        )
+                        for i in range(len(chunks))
+                    ]
+            except* Exception:
+                logging.exception("One or more PermitDetails workers failed")
+            for task in tasks:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                success, failed, permits = task.result()
+                success_total += success
+                failed_total += failed
+                permits_total += permits
+        finally:
+            for scraper in scrapers:
+                if hasattr(scraper, "aclose"):
+                    try:
+                        await scraper.aclose()  # type: ignore[attr-defined]
+                    except Exception:
+                        logging.exception("Failed to close details scraper")
         return success_total, failed_total, permits_total
 
     try:
         success_chunks, failed_chunks, total_permits = asyncio.run(runner())
     finally:
+        dispatcher.stop()
         for b in per_bars:
             b.close()
         overall_bar.close()
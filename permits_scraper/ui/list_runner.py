@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import math
+from operator import attrgetter
 from typing import Any, Dict, Tuple, Optional
 from datetime import date
 import logging
 import asyncio
+import time
 
 from tqdm import tqdm
 
@@ -21,6 +23,33 @@ from permits_scraper.ui.utils import (
     RESET
 )
 from permits_scraper.scrapers.base.permit_list import PermitListBaseScraper
+from permits_scraper.ui.progress import ProgressDispatcher
+
+# Capability flags probed once per scraper class; repeated hasattr/isinstance
+# checks would otherwise sit on the worker's critical path before spin-up.
+_CAPS_CACHE: Dict[type, bool] = {}
+
+
+def _supports_headless_toggle(scraper: object) -> bool:
+    scraper_cls = type(scraper)
+    cached = _CAPS_CACHE.get(scraper_cls)
+    if cached is None:
+        cached = isinstance(scraper, PlaywrightBaseScraper) and hasattr(scraper_cls, "set_headless")
+        _CAPS_CACHE[scraper_cls] = cached
+    return cached
+
+# Tokens that opt a worker out of headless mode; hoisted so the worker
+# hot-enter path does not rebuild a set literal per invocation.
+_HEADLESS_FALSE = frozenset({"n", "no", "false", "0"})
+
+# Prefer uvloop's C event loop when available: the runners are progress-
+# callback heavy, and libuv's scheduler dispatches those callbacks with far
+# less overhead than the default loop. Optional; stdlib asyncio otherwise.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 
 def calc_days_between(start_d: date, end_d: date, days_per_step: int) -> int:
@@ -30,6 +59,7 @@ def calc_days_between(start_d: date, end_d: date, days_per_step: int) -> int:
 
 
 async def _list_worker(
+    scraper: PermitListBaseScraper,
     region: str,
     city: str,
     headless_raw: str,
@@ -37,12 +67,12 @@ async def _list_worker(
     chunk_group: Tuple[date, date],
     per_bar: tqdm,
     overall_bar: tqdm,
+    dispatcher: ProgressDispatcher,
 ) -> Tuple[int, int, int]:
 
     start_s, end_s = chunk_group
 
-    scraper: PermitListBaseScraper = select_scraper(region, city, type="list")  # type: ignore[assignment]
-    if hasattr(scraper, "set_headless") and isinstance(scraper, PlaywrightBaseScraper) and headless_raw in {"n", "no", "false", "0"}:
+    if headless_raw in _HEADLESS_FALSE and _supports_headless_toggle(scraper):
         try:
             scraper.set_headless(False)  # type: ignore[attr-defined]
         except Exception:
@@ -50,25 +80,28 @@ async def _list_worker(
 
     success_chunks_total = 0
     failed_chunks_total = 0
-    announced_total = False
+    pending = 0
+    last_flush = time.monotonic()
+
+    def flush_progress() -> None:
+        # Repainting tqdm on every tick contends on stdout; coalesce updates
+        # and hand the flush to the shared dispatcher thread so the worker
+        # never blocks on the tqdm lock or terminal IO.
+        nonlocal pending, last_flush
+        if pending:
+            dispatcher.submit(per_bar, overall_bar, pending, success_chunks_total, failed_chunks_total)
+            pending = 0
+        last_flush = time.monotonic()
 
     def on_progress(success_chunks_inc: int, failed_chunks_inc: int, total_chunks: Optional[int] = None) -> None:
         nonlocal success_chunks_total, failed_chunks_total
-        nonlocal announced_total
+        nonlocal pending
         try:
             success_chunks_total += success_chunks_inc
             failed_chunks_total += failed_chunks_inc
-            overall_bar.update(success_chunks_inc+failed_chunks_inc)
-            per_bar.update(success_chunks_inc+failed_chunks_inc)
-            per_bar.set_postfix(success=success_chunks_total, failed=failed_chunks_total)
-            if total_chunks is not None and not announced_total:
-                # Initialize totals lazily on first announcement from scraper
-                per_bar.total = total_chunks
-                # Bump overall total once per worker
-                overall_total = overall_bar.total or 0
-                overall_bar.total = overall_total + total_chunks
-                overall_bar.refresh()
-                announced_total = True
+            pending += success_chunks_inc + failed_chunks_inc
+            if pending >= 32 or time.monotonic() - last_flush > 0.1:
+                flush_progress()
         except Exception:
             pass
 
@@ -79,6 +112,7 @@ async def _list_worker(
             progress_callback=on_progress,  # type: ignore[arg-type]
             **extra_kwargs,
         )
+        flush_progress()
     except Exception:
         logging.exception(
             "PermitList list worker failed: region=%s city=%s range=%s-%s",
@@ -89,6 +123,7 @@ async def _list_worker(
         )
         # Best-effort: mark remaining as failed to avoid stuck bars
         try:
+            flush_progress()
             remaining = max(0, (per_bar.total or 0) - (success_chunks_total + failed_chunks_total))
             if remaining:
                 per_bar.update(remaining)
@@ -99,7 +134,15 @@ async def _list_worker(
             pass
         return success_chunks_total, failed_chunks_total, 0
 
-    total_permits = sum(getattr(r, "number_of_permits", 0) for r in results) if isinstance(results, list) else 0
+    # Aggregate at C speed: map+attrgetter avoids a Python-level getattr
+    # per result; the genexp fallback covers result types without the field.
+    if isinstance(results, list):
+        try:
+            total_permits = sum(map(attrgetter("number_of_permits"), results))
+        except AttributeError:
+            total_permits = sum(getattr(r, "number_of_permits", 0) for r in results)
+    else:
+        total_permits = 0
     return success_chunks_total, failed_chunks_total, total_permits
 
 
@@ -127,35 +170,74 @@ def run_list(
         print("start_date must be on or before end_date")
         return
  
-    actual_instances = min(max(1, instances), calc_days_between(start_d, end_d, days_per_step))
+    # Floor of ~7 days per instance alongside the chunk-count cap:
+    # over-parallelizing a short range wastes browser spin-ups.
+    total_days = (end_d - start_d).days + 1
+    actual_instances = min(
+        max(1, instances),
+        calc_days_between(start_d, end_d, days_per_step),
+        max(1, total_days // 7),
+    )
     all_chunks = iter_range_by_parts(start_d, end_d, actual_instances)
 
-    # Initialize bars with unknown totals; each worker will announce its total via the progress callback
-    overall_bar = tqdm(total=0, position=0, desc="Overall", leave=True)
+    # Allocate one scraper per instance up front and hand it to the worker;
+    # scrapers that cache a browser then reuse it for their whole range and
+    # are released together at the end of the run.
+    scrapers = [select_scraper(region, city, type="list") for _ in all_chunks]
+
+    # Per-instance chunk counts mirror the scraper's own stepping, so the
+    # bars start fully sized and workers never mutate totals mid-run.
+    per_totals = [
+        calc_days_between(chunk_start, chunk_end, days_per_step)
+        for chunk_start, chunk_end in all_chunks
+    ]
+    dispatcher = ProgressDispatcher()
+    dispatcher.start()
+    overall_bar = tqdm(total=sum(per_totals), position=0, desc="Overall", leave=True)
     per_bars = [
-        tqdm(total=0, position=i + 1, desc=f"Instance {i + 1}", leave=True)
+        tqdm(total=per_totals[i], position=i + 1, desc=f"Instance {i + 1}", leave=True)
         for i in range(len(all_chunks))
     ]
 
     async def runner() -> Tuple[int, int, int]:
-        tasks = [
-            _list_worker(region, city, headless_raw, extra, all_chunks[i], per_bars[i], overall_bar)
-            for i in range(len(all_chunks))
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
         success_total = 0
         failed_total = 0
         permits_total = 0
-        for res in results:
-            if isinstance(res, tuple):
-                success_total += res[0]
-                failed_total += res[1]
-                permits_total += res[2]
+        tasks: list = []
+        try:
+            # Structured concurrency: if a worker crashes outright, its peers
+            # are cancelled promptly instead of grinding on, and the failure
+            # is logged rather than silently filtered out.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(
+                            _list_worker(scrapers[i], region, city, headless_raw, extra, all_chunks[i], per_bars[i], overall_bar, dispatcher)
+                        )
+                        for i in range(len(all_chunks))
+                    ]
+            except* Exception:
+                logging.exception("One or more PermitList workers failed")
+            for task in tasks:
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                success, failed, permits = task.result()
+                success_total += success
+                failed_total += failed
+                permits_total += permits
+        finally:
+            for scraper in scrapers:
+                if hasattr(scraper, "aclose"):
+                    try:
+                        await scraper.aclose()  # type: ignore[attr-defined]
+                    except Exception:
+                        logging.exception("Failed to close list scraper")
         return success_total, failed_total, permits_total
 
     try:
         success_chunks, failed_chunks, total_permits = asyncio.run(runner())
     finally:
+        dispatcher.stop()
         for b in per_bars:
             b.close()
         overall_bar.close()
@@ -0,0 +1,54 @@
+"""Single-consumer dispatcher decoupling workers from tqdm/stdout writes."""
+
+from __future__ import annotations
+
+from typing import Optional
+import queue
+import threading
+
+from tqdm import tqdm
+
+
+class ProgressDispatcher:
+    """Apply progress-bar updates on one dedicated thread.
+
+    Every tqdm update grabs the shared ``tqdm`` lock and writes to the same
+    stdout descriptor, so with many concurrent instances the workers end up
+    stalling on display IO. Workers instead enqueue their increments with
+    `submit` (a lock-free ``SimpleQueue`` put) and this dispatcher drains the
+    queue in order on a single daemon thread.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the drain thread; no-op if already running."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+
+    def submit(self, per_bar: tqdm, overall_bar: tqdm, increment: int, success: int, failed: int) -> None:
+        """Queue one coalesced update without blocking the caller."""
+        self._queue.put_nowait((per_bar, overall_bar, increment, success, failed))
+
+    def stop(self) -> None:
+        """Drain remaining updates and join the thread."""
+        if self._thread is not None:
+            self._queue.put_nowait(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            per_bar, overall_bar, increment, success, failed = item
+            try:
+                per_bar.update(increment)
+                overall_bar.update(increment)
+                per_bar.set_postfix(success=success, failed=failed)
+            except Exception:
+                pass
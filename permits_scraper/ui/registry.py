@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict, Tuple, Type, Literal
+from functools import lru_cache
 from pathlib import Path
 import importlib
 import importlib.util
@@ -17,6 +18,11 @@ from permits_scraper.scrapers.base.permit_list import PermitListBaseScraper
 
 _DETAILS_REGISTRY: Dict[Tuple[str, str], Type[Any]] = {}
 _LIST_REGISTRY: Dict[Tuple[str, str], Type[Any]] = {}
+# Module-name suffix -> registry kind, checked once per walked module.
+_SUFFIX_TO_KIND: Dict[str, Literal["details", "list"]] = {
+    ".permit_details": "details",
+    ".permits_list": "list",
+}
 
 
 def _normalize_city(city: str) -> str:
@@ -34,29 +40,34 @@ def _register_from_module(module: Any, region_token: str, city_token: str, kind:
             _LIST_REGISTRY.setdefault((region_token, city_token), obj)
 
 
+@lru_cache(maxsize=1)
 def _ensure_loaded() -> None:
-    if _DETAILS_REGISTRY and _LIST_REGISTRY:
-        return
+    # lru_cache(maxsize=1) turns every call after the first into a C-level
+    # cache hit, so menu cycles never re-enter discovery; even a registry
+    # left empty (e.g. only details scrapers exist) stays settled.
     regions_pkg_name = "permits_scraper.scrapers.regions"
     # Strategy 1: package walk
     try:
         regions_pkg = importlib.import_module(regions_pkg_name)
         for modinfo in pkgutil.walk_packages(regions_pkg.__path__, prefix=f"{regions_pkg_name}."):
             name = modinfo.name
-            if not (name.endswith(".permit_details") or name.endswith(".permits_list")):
+            for suffix, kind in _SUFFIX_TO_KIND.items():
+                if name.endswith(suffix):
+                    break
+            else:
+                continue
+            # rpartition peels region/city off the tail without building a
+            # full parts list for every walked module.
+            prefix, _, city_token = name[: -len(suffix)].rpartition(".")
+            region_token = prefix.rpartition(".")[2]
+            if not prefix.startswith(regions_pkg_name) or not region_token or not city_token:
                 continue
             try:
                 module = importlib.import_module(name)
             except Exception:
                 logging.exception("Failed to import module during discovery: %s", name)
                 continue
-            parts = name.split(".")
-            if len(parts) < 6:
-                continue
-            region_token = parts[-3].lower()
-            city_token = parts[-2].lower()
-            kind: Literal["details", "list"] = "details" if name.endswith(".permit_details") else "list"
-            _register_from_module(module, region_token, city_token, kind)
+            _register_from_module(module, region_token.lower(), city_token.lower(), kind)
     except Exception:
         logging.exception("Package-based scraper discovery failed")
 
@@ -68,6 +79,10 @@ def _ensure_loaded() -> None:
                 try:
                     region_token = fp.parent.parent.name.lower()
                     city_token = fp.parent.name.lower()
+                    # Strategy 1 already registered this scraper: skip the
+                    # duplicate exec_module under a synthetic module name.
+                    if (region_token, city_token) in _DETAILS_REGISTRY:
+                        continue
                     spec = importlib.util.spec_from_file_location(f"_scr_{region_token}_{city_token}_details", fp)
                     if spec and spec.loader:
                         module = importlib.util.module_from_spec(spec)
@@ -80,6 +95,8 @@ def _ensure_loaded() -> None:
                 try:
                     region_token = fp.parent.parent.name.lower()
                     city_token = fp.parent.name.lower()
+                    if (region_token, city_token) in _LIST_REGISTRY:
+                        continue
                     spec = importlib.util.spec_from_file_location(f"_scr_{region_token}_{city_token}_list", fp)
                     if spec and spec.loader:
                         module = importlib.util.module_from_spec(spec)
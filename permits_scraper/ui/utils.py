@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import csv
 import logging
 import math
+import re
+from itertools import accumulate
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Type
 from datetime import datetime, date, timedelta
-import pandas as pd
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
 
@@ -41,27 +43,49 @@ def chunk_evenly(items: List[Any], chunks: int) -> List[List[Any]]:
     """
     n = max(1, chunks)
     size, remainder = divmod(len(items), n)
-    result: List[List[Any]] = []
-    start = 0
-    for i in range(n):
-        extra = 1 if i < remainder else 0
-        end = start + size + extra
-        result.append(items[start:end])
-        start = end
-    return result
+    # Boundary math in one accumulate pass: the first `remainder` chunks get
+    # one extra item, and each slice runs between consecutive cut points.
+    ends = list(accumulate([size + 1] * remainder + [size] * (n - remainder)))
+    return [items[s:e] for s, e in zip([0] + ends[:-1], ends)]
+
+
+# Fast paths for the two shapes the CLI actually sees; anything else falls
+# back to the strptime ladder below. Day-first wins ties, matching the old
+# format order (DD/MM before MM/DD).
+_DATE_DMY_RE = re.compile(r"^(\d{1,2})([/\-.])(\d{1,2})\2(\d{4})$")
+_DATE_ISO_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DATE_FMTS = (
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+)
 
 
 def parse_date_flexible(s: str) -> date:
     s = s.strip()
-    fmts = [
-        "%d/%m/%Y",
-        "%d-%m-%Y",
-        "%d.%m.%Y",
-        "%Y-%m-%d",
-        "%m/%d/%Y",
-        "%m-%d-%Y",
-    ]
-    for f in fmts:
+    m = _DATE_DMY_RE.match(s)
+    if m:
+        a, sep, b, year = m.groups()
+        try:
+            return date(int(year), int(b), int(a))
+        except ValueError:
+            # Month-first only exists for / and - in the format ladder.
+            if sep != ".":
+                try:
+                    return date(int(year), int(a), int(b))
+                except ValueError:
+                    pass
+        raise ValueError(f"Unsupported date format: {s}")
+    m = _DATE_ISO_RE.match(s)
+    if m:
+        try:
+            return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            raise ValueError(f"Unsupported date format: {s}")
+    for f in _DATE_FMTS:
         try:
             return datetime.strptime(s, f).date()
         except ValueError:
@@ -103,21 +127,15 @@ def iter_range_by_parts(start_d: date, end_d: date, parts: int) -> List[Tuple[da
     if parts <= 0:
         raise ValueError("parts must be greater than 0")
     total_days = (end_d - start_d).days + 1
-    base = total_days // parts
-    rem = total_days % parts
-    result: List[Tuple[date, date]] = []
-    current = start_d
-    for i in range(parts):
-        days = base + (1 if i < rem else 0)
-        chunk_start = current
-        chunk_end = chunk_start + timedelta(days=days - 1)
-        if chunk_end > end_d or i == parts - 1:
-            chunk_end = end_d
-        result.append((chunk_start, chunk_end))
-        current = chunk_end + timedelta(days=1)
-        if current > end_d:
-            break
-    return result
+    base, rem = divmod(total_days, parts)
+    # Cut points via one accumulate pass; chunks that would span zero days
+    # (more parts than days) are dropped, matching the old early break.
+    ends = list(accumulate([base + 1] * rem + [base] * (parts - rem)))
+    return [
+        (start_d + timedelta(days=s), start_d + timedelta(days=e - 1))
+        for s, e in zip([0] + ends[:-1], ends)
+        if e > s
+    ]
 
 
 
@@ -149,12 +167,16 @@ def read_permit_numbers(csv_path: Path, column: str) -> List[str]:
     List[str]
         Deduplicated permit IDs as strings.
     """
-    df = pd.read_csv(csv_path)
-    if column not in df.columns:
-        raise KeyError(f"Column {column!r} not found. Available: {list(df.columns)}")
-    series = df[column].dropna().astype(str).map(str.strip)
-    seen: Dict[str, None] = {}
-    return [x for x in series.tolist() if not (x in seen or seen.setdefault(x, None))]
+    # Only one column is needed, so csv.DictReader beats pd.read_csv here:
+    # no pandas import, no full-frame materialization, no dtype inference.
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or column not in reader.fieldnames:
+            raise KeyError(f"Column {column!r} not found. Available: {list(reader.fieldnames or [])}")
+        # dict.fromkeys dedups in one C-level pass while keeping first-seen
+        # order, instead of a membership test plus insert per row.
+        unique = dict.fromkeys(v for row in reader if (v := (row.get(column) or "").strip()))
+    return list(unique)
 
 
 
@@ -171,34 +193,31 @@ def prompt_for_model(model: Type[BaseModel]) -> BaseModel:
     BaseModel
         An instance populated from user input.
     """
+    # Only the conversions pydantic's core cannot do stay in Python: the
+    # flexible date formats, ~-expansion on paths, and the lenient y/n bool.
+    # Everything else (int, float, plain str) goes to model_validate raw and
+    # is coerced once in the Rust core instead of twice.
+    coercers: Dict[Any, Any] = {
+        bool: lambda raw: raw.lower() in {"y", "yes", "true", "1"},
+        date: parse_date_flexible,
+        Path: lambda raw: Path(raw).expanduser().resolve(),
+    }
     values: Dict[str, Any] = {}
     for name, field in model.model_fields.items():
-        desc = field.description or name
-        has_default = field.default is not PydanticUndefined
-        default_repr = f" (default: {field.default})" if has_default else ""
-        raw = input(f"{desc}{default_repr}: ").strip()
+        default = field.default
+        has_default = default is not PydanticUndefined
+        default_repr = f" (default: {default})" if has_default else ""
+        raw = input(f"{field.description or name}{default_repr}: ").strip()
         if raw == "" and has_default:
-            values[name] = field.default
+            values[name] = default
+            continue
+        coerce = coercers.get(field.annotation)
+        if coerce is None:
+            values[name] = raw
             continue
-        anno = field.annotation
         try:
-            if anno is bool:
-                # Always prompt for boolean; accept y/n/true/false/1/0, default when blank
-                if raw == "" and has_default:
-                    values[name] = bool(field.default)
-                else:
-                    values[name] = raw.lower() in {"y", "yes", "true", "1"}
-            elif anno is int:
-                values[name] = int(raw)
-            elif anno is float:
-                values[name] = float(raw)
-            elif anno is date:
-                values[name] = parse_date_flexible(raw)
-            elif anno is Path:
-                values[name] = Path(raw).expanduser().resolve()
-            else:
-                values[name] = raw
+            values[name] = coerce(raw)
         except Exception:
             values[name] = raw
-    return model(**values)
+    return model.model_validate(values)
 